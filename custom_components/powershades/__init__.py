@@ -1,6 +1,7 @@
 """The PowerShades integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from getmac import get_mac_address
@@ -11,13 +12,18 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device_registry import format_mac
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN, OP_GET_SERIAL
 from .coordinator import PowerShadesConfigEntry, PowerShadesCoordinator
 from .discovery import async_start_discovery
 from .protocol import parse_serial_reply
 from .services import async_setup_services
-from .udp import PowerShadesConnection, PowerShadesTimeoutError
+from .udp import (
+    PowerShadesConnection,
+    PowerShadesEndpoint,
+    PowerShadesTimeoutError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +31,26 @@ PLATFORMS = [Platform.BUTTON, Platform.COVER, Platform.SENSOR]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# UDP socket shared by all configured shades
+DATA_ENDPOINT: HassKey[PowerShadesEndpoint] = HassKey(f"{DOMAIN}_endpoint")
+
+
+async def _async_query_model(
+    entry: PowerShadesConfigEntry, coordinator: PowerShadesCoordinator
+) -> int | None:
+    """Ask the shade for its model byte if the entry lacks it.
+
+    Returns None if the model is already known or the query fails.
+    """
+    if entry.data.get("model") is not None:
+        return None
+    try:
+        reply = await coordinator.connection.async_request(OP_GET_SERIAL)
+    except PowerShadesTimeoutError:
+        return None
+    parsed = parse_serial_reply(reply)
+    return parsed["model"] if parsed is not None else None
+
 
 async def _async_update_device_metadata(
     hass: HomeAssistant, entry: PowerShadesConfigEntry,
@@ -34,27 +60,26 @@ async def _async_update_device_metadata(
 
     Called right after a successful first refresh, so the device is
     known reachable and the ARP cache is warm from the UDP exchange.
-    Best-effort: silently keeps the entry unchanged on lookup failure.
+    The ARP lookup and the model query are independent and run
+    concurrently. Best-effort: silently keeps the entry unchanged on
+    lookup failure.
     """
     updates: dict = {}
 
-    mac = await hass.async_add_executor_job(
-        lambda: get_mac_address(ip=entry.data["ip"]))
+    mac, model = await asyncio.gather(
+        hass.async_add_executor_job(
+            lambda: get_mac_address(ip=entry.data["ip"])),
+        _async_query_model(entry, coordinator),
+    )
     if mac and mac != "00:00:00:00:00:00":
         mac = format_mac(mac)
         coordinator.mac_address = mac
         if mac != entry.data.get("mac"):
             updates["mac"] = mac
 
-    if entry.data.get("model") is None:
-        try:
-            reply = await coordinator.connection.async_request(OP_GET_SERIAL)
-        except PowerShadesTimeoutError:
-            reply = None
-        parsed = parse_serial_reply(reply) if reply else None
-        if parsed is not None:
-            coordinator.model = parsed["model"]
-            updates["model"] = parsed["model"]
+    if model is not None:
+        coordinator.model = model
+        updates["model"] = model
 
     if updates:
         _LOGGER.debug("Updating metadata for shade %s: %s",
@@ -65,6 +90,7 @@ async def _async_update_device_metadata(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the PowerShades component."""
+    hass.data[DATA_ENDPOINT] = PowerShadesEndpoint()
     async_setup_services(hass)
     async_start_discovery(hass)
     return True
@@ -74,7 +100,8 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: PowerShadesConfigEntry
 ) -> bool:
     """Set up PowerShades from a config entry."""
-    connection = PowerShadesConnection(entry.data["ip"])
+    connection = PowerShadesConnection(
+        entry.data["ip"], hass.data[DATA_ENDPOINT])
     await connection.async_connect()
 
     coordinator = PowerShadesCoordinator(hass, entry, connection)
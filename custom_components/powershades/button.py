@@ -15,7 +15,6 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import PowerShadesConfigEntry, PowerShadesCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -125,14 +124,8 @@ class PowerShadesButton(
         """Initialize the PowerShades button."""
         super().__init__(coordinator)
         self.entity_description = description
-        if coordinator.serial_number:
-            self._attr_unique_id = (
-                f"{DOMAIN}_{coordinator.serial_number}_{description.key}"
-            )
-        else:
-            self._attr_unique_id = (
-                f"{DOMAIN}_{coordinator.entry_id}_{description.key}"
-            )
+        self._attr_unique_id = (
+            f"{coordinator.unique_id_base}_{description.key}")
         self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
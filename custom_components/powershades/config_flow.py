@@ -1,6 +1,7 @@
 """Config flow for the PowerShades integration."""
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 from typing import Any
@@ -11,17 +12,19 @@ from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.helpers.device_registry import format_mac
 from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
 
-from .const import DOMAIN
-from .udp import (
-    PowerShadesTimeoutError,
-    async_discover_devices,
-    async_get_device_info,
-)
+from .const import DISCOVERY_IDLE_TIMEOUT, DOMAIN
+from .discovery import async_get_discovered_devices
+from .udp import PowerShadesTimeoutError, async_get_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
 MANUAL_ENTRY = "manual"
 
+# Discovered shades probed at once while building the device picker
+PROBE_CONCURRENCY = 8
+
+STEP_MANUAL_DATA_SCHEMA = vol.Schema({vol.Required("ip"): str})
+
 
 class PowerShadesConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a PowerShades config flow."""
@@ -31,6 +34,8 @@ class PowerShadesConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered: dict[str, dict] = {}
+        self._pick_device_schema: vol.Schema | None = None
+        self._probed: dict[str, dict] = {}
         self._discovered_ip: str | None = None
         self._discovered_serial: int | None = None
         self._discovered_name: str | None = None
@@ -41,12 +46,55 @@ class PowerShadesConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step: discover devices on the network."""
-        discovered = await async_discover_devices(self.hass)
-        self._discovered = {device["ip"]: device for device in discovered}
-        if not self._discovered:
+        # Don't keep the user waiting for the full broadcast window once
+        # the shades on the network have stopped answering.
+        discovered = await async_get_discovered_devices(
+            self.hass, idle_timeout=DISCOVERY_IDLE_TIMEOUT)
+        if not discovered:
             return await self.async_step_manual()
+        # Probing a shade takes over its status pushes, so leave
+        # configured shades to their coordinators.
+        configured = {
+            entry.data["ip"] for entry in self._async_current_entries()
+        }
+        self._probed = await self._async_probe_devices(
+            [device["ip"] for device in discovered
+             if device["ip"] not in configured])
+        self._discovered = {}
+        choices: dict[str, str] = {}
+        for device in discovered:
+            ip = device["ip"]
+            self._discovered[ip] = device
+            label = f"{ip} (Serial: {device['serial']})"
+            if (info := self._probed.get(ip)) is not None and info["name"]:
+                label = f"{info['name']} - {label}"
+            choices[ip] = label
+        choices[MANUAL_ENTRY] = "Enter IP address manually"
+        self._pick_device_schema = vol.Schema(
+            {vol.Required("device"): vol.In(choices)})
         return await self.async_step_pick_device()
 
+    async def _async_probe_devices(self, ips: list[str]) -> dict[str, dict]:
+        """Probe discovered shades concurrently for their serial and name.
+
+        Shades that do not answer are left out; picking one probes it
+        again and reports the error then.
+        """
+        semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+        probed: dict[str, dict] = {}
+
+        async def _async_probe(ip: str) -> None:
+            async with semaphore:
+                try:
+                    probed[ip] = await async_get_device_info(ip)
+                except PowerShadesTimeoutError:
+                    _LOGGER.debug("Device at %s did not respond to probe", ip)
+
+        async with asyncio.TaskGroup() as tg:
+            for ip in ips:
+                tg.create_task(_async_probe(ip))
+        return probed
+
     async def async_step_pick_device(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -61,15 +109,9 @@ class PowerShadesConfigFlow(ConfigFlow, domain=DOMAIN):
             if result is not None:
                 return result
 
-        choices = {
-            ip: f"{ip} (Serial: {device['serial']})"
-            for ip, device in self._discovered.items()
-        }
-        choices[MANUAL_ENTRY] = "Enter IP address manually"
-
         return self.async_show_form(
             step_id="pick_device",
-            data_schema=vol.Schema({vol.Required("device"): vol.In(choices)}),
+            data_schema=self._pick_device_schema,
             errors=errors,
         )
 
@@ -92,7 +134,7 @@ class PowerShadesConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema({vol.Required("ip"): str}),
+            data_schema=STEP_MANUAL_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -128,11 +170,10 @@ class PowerShadesConfigFlow(ConfigFlow, domain=DOMAIN):
         # don't offer a duplicate of an already-configured shade.
         self._async_abort_entries_match({"ip": ip})
 
-        await self.async_set_unique_id(str(serial))
         updates = {"ip": ip}
         if self._discovered_mac:
             updates["mac"] = self._discovered_mac
-        self._abort_if_unique_id_configured(updates=updates)
+        await self._async_set_serial_unique_id(serial, updates)
 
         self._discovered_ip = ip
         self._discovered_serial = serial
@@ -178,21 +219,37 @@ class PowerShadesConfigFlow(ConfigFlow, domain=DOMAIN):
             },
         )
 
+    async def _async_set_serial_unique_id(
+        self, serial: int, updates: dict[str, Any]
+    ) -> None:
+        """Claim the shade's serial as unique ID, aborting if configured."""
+        await self.async_set_unique_id(str(serial))
+        self._abort_if_unique_id_configured(updates=updates)
+
     async def _async_validate_and_create(
         self, ip: str, errors: dict[str, str]
     ) -> ConfigFlowResult | None:
-        """Probe the device and create the entry, or record an error."""
+        """Probe the device and create the entry, or record an error.
+
+        Reuses the probe made while building the device picker, if any.
+        """
         self._async_abort_entries_match({"ip": ip})
 
-        try:
-            info = await async_get_device_info(ip)
-        except PowerShadesTimeoutError:
-            _LOGGER.debug("Device at %s did not respond to probe", ip)
-            errors["base"] = "cannot_connect"
-            return None
+        # The serial of a discovered shade is already known — reject an
+        # already-configured one before probing the network.
+        if (device := self._discovered.get(ip)) is not None:
+            await self._async_set_serial_unique_id(
+                device["serial"], {"ip": ip})
+
+        if (info := self._probed.get(ip)) is None:
+            try:
+                info = await async_get_device_info(ip)
+            except PowerShadesTimeoutError:
+                _LOGGER.debug("Device at %s did not respond to probe", ip)
+                errors["base"] = "cannot_connect"
+                return None
 
-        await self.async_set_unique_id(str(info["serial"]))
-        self._abort_if_unique_id_configured(updates={"ip": ip})
+        await self._async_set_serial_unique_id(info["serial"], {"ip": ip})
 
         name = info["name"]
         title = f"PowerShade {name}" if name else f"PowerShade {ip}"
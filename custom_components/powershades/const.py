@@ -30,5 +30,7 @@ MODEL_NAMES = {
 
 # Timing
 DISCOVERY_TIMEOUT = 3.0
+# Interactive discovery ends this long after the last reply
+DISCOVERY_IDLE_TIMEOUT = 0.5
 REQUEST_TIMEOUT = 2.0
 REQUEST_RETRIES = 2
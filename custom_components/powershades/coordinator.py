@@ -1,14 +1,17 @@
 """PowerShades data update coordinator."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, replace
 from datetime import timedelta
+from functools import cached_property
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
@@ -49,6 +52,13 @@ _LOGGER = logging.getLogger(__name__)
 # Within this distance of the target the shade counts as arrived
 POSITION_TOLERANCE = 2
 
+UPDATE_INTERVAL = timedelta(seconds=10)
+# Poll faster while the position is unknown
+UPDATE_INTERVAL_POSITION_UNKNOWN = timedelta(seconds=5)
+# Status pushes arriving closer together than this (seconds) are
+# coalesced into one update carrying the latest status
+STATUS_PUSH_COOLDOWN = 0.15
+
 PowerShadesConfigEntry = ConfigEntry["PowerShadesCoordinator"]
 
 
@@ -78,22 +88,41 @@ class PowerShadesCoordinator(DataUpdateCoordinator[PowerShadesData]):
         self.ip_address: str = entry.data["ip"]
         self.entry_id = entry.entry_id
         self.serial_number = entry.data.get("serial")
+        # Prefix shared by the unique IDs of all entities of this shade
+        self.unique_id_base = (
+            f"{DOMAIN}_{self.serial_number or self.entry_id}")
         self.device_name = entry.data.get("name")
         self.mac_address: str | None = entry.data.get("mac")
         self.model: int | None = entry.data.get("model")
         self._target_position: int | None = None
+        self._status_request: asyncio.Task[bytes] | None = None
         super().__init__(
             hass,
             _LOGGER,
             config_entry=entry,
             name=f"PowerShades {self.ip_address}",
-            update_interval=timedelta(seconds=10),
+            update_interval=UPDATE_INTERVAL,
+            # PowerShadesData compares by value; an idle shade's poll
+            # usually returns the same state and needs no entity write
+            always_update=False,
+        )
+        self._pending_status: StatusReply | None = None
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=STATUS_PUSH_COOLDOWN,
+            immediate=True,
+            function=self._apply_pending_status,
         )
         connection.set_status_callback(self._handle_status_push)
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
-        """Return device info."""
+        """Return device info, shared by all entities of this shade.
+
+        Built on first access, after setup has filled in the MAC and
+        model metadata.
+        """
         if self.device_name:
             name = f"PowerShade {self.device_name}"
         else:
@@ -134,13 +163,43 @@ class PowerShadesCoordinator(DataUpdateCoordinator[PowerShadesData]):
 
     @callback
     def _handle_status_push(self, status: StatusReply) -> None:
-        """Handle a status packet (runs on the event loop)."""
-        self.async_set_updated_data(self._data_from_status(status))
+        """Handle a status packet (runs on the event loop).
+
+        A moving shade pushes status in bursts; the first push is
+        applied at once and the rest are coalesced by the debouncer.
+        """
+        self._pending_status = status
+        self._push_debouncer.async_schedule_call()
+
+    @callback
+    def _apply_pending_status(self) -> None:
+        """Apply the latest pushed status."""
+        status, self._pending_status = self._pending_status, None
+        if status is not None:
+            self.async_set_updated_data(self._data_from_status(status))
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending push updates and shut down the coordinator."""
+        self._push_debouncer.async_shutdown()
+        await super().async_shutdown()
+
+    async def _async_request_status(self) -> bytes:
+        """Request the shade's status, joining a request already in flight.
+
+        A scheduled poll and a requested refresh can overlap; rather
+        than queue a second exchange behind the first, both take the
+        same reply.
+        """
+        if self._status_request is None or self._status_request.done():
+            self._status_request = self.hass.async_create_task(
+                self.connection.async_request(OP_GET_STATUS))
+        # Shielded so one cancelled caller does not fail the others
+        return await asyncio.shield(self._status_request)
 
     async def _async_update_data(self) -> PowerShadesData:
         """Poll the device for status."""
         try:
-            raw = await self.connection.async_request(OP_GET_STATUS)
+            raw = await self._async_request_status()
         except PowerShadesTimeoutError as err:
             raise UpdateFailed(
                 f"Shade at {self.ip_address} did not reply: {err}"
@@ -149,14 +208,24 @@ class PowerShadesCoordinator(DataUpdateCoordinator[PowerShadesData]):
         if status is None:
             raise UpdateFailed(
                 f"Malformed status reply from {self.ip_address}")
+        # A polled status supersedes any push still waiting out the
+        # debouncer cooldown
+        self._pending_status = None
         data = self._data_from_status(status)
-        # Poll faster while the position is unknown
-        self.update_interval = timedelta(
-            seconds=5 if data.position is None else 10)
+        self.update_interval = (
+            UPDATE_INTERVAL_POSITION_UNKNOWN
+            if data.position is None else UPDATE_INTERVAL
+        )
         return data
 
     def _set_target(self, position: int | None) -> None:
-        """Update the movement target and notify entities immediately."""
+        """Update the movement target and notify entities immediately.
+
+        Does nothing if the target is unchanged, e.g. when stopping a
+        shade that is already idle.
+        """
+        if position == self._target_position:
+            return
         self._target_position = position
         if self.data is not None:
             self.async_set_updated_data(
@@ -176,22 +245,31 @@ class PowerShadesCoordinator(DataUpdateCoordinator[PowerShadesData]):
                 f"Shade at {self.ip_address} did not acknowledge the command"
             ) from err
 
-    async def async_set_position(self, position: int) -> None:
-        """Move the shade to a position (0=closed, 100=open)."""
-        self._set_target(position)
+    async def _async_move(
+        self, op: int, payload: bytes, target: int | None
+    ) -> None:
+        """Send a movement command, updating the target optimistically.
+
+        The previous target is restored if the shade does not
+        acknowledge the command.
+        """
+        previous = self._target_position
+        self._set_target(target)
         try:
-            await self._async_command(
-                OP_SET_POSITION, build_set_position_payload(position))
+            await self._async_command(op, payload)
         except HomeAssistantError:
-            self._set_target(None)
+            self._set_target(previous)
             raise
         await self.async_request_refresh()
 
+    async def async_set_position(self, position: int) -> None:
+        """Move the shade to a position (0=closed, 100=open)."""
+        await self._async_move(
+            OP_SET_POSITION, build_set_position_payload(position), position)
+
     async def async_stop(self) -> None:
         """Stop shade movement."""
-        self._set_target(None)
-        await self._async_command(OP_JOG_STOP)
-        await self.async_request_refresh()
+        await self._async_move(OP_JOG_STOP, b"", None)
 
     async def async_toggle(self) -> None:
         """Toggle the shade: stop if moving, otherwise open/close."""
@@ -209,13 +287,11 @@ class PowerShadesCoordinator(DataUpdateCoordinator[PowerShadesData]):
 
     async def async_jog_up(self) -> None:
         """Jog the shade up until it reaches a limit or is stopped."""
-        await self._async_command(OP_JOG_UP)
-        await self.async_request_refresh()
+        await self._async_move(OP_JOG_UP, b"", None)
 
     async def async_jog_down(self) -> None:
         """Jog the shade down until it reaches a limit or is stopped."""
-        await self._async_command(OP_JOG_DOWN)
-        await self.async_request_refresh()
+        await self._async_move(OP_JOG_DOWN, b"", None)
 
     async def async_identify(self) -> None:
         """Make the shade motor indicate (wiggle) to identify it."""
@@ -265,6 +341,7 @@ class PowerShadesCoordinator(DataUpdateCoordinator[PowerShadesData]):
                 f"Shade at {self.ip_address} returned an empty name")
 
         self.device_name = confirmed
+        self.__dict__.pop("device_info", None)  # rebuild with the new name
         self.hass.config_entries.async_update_entry(
             self.config_entry,
             data={**self.config_entry.data, "name": confirmed},
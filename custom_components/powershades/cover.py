@@ -10,11 +10,10 @@ from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import PowerShadesConfigEntry, PowerShadesCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,44 +48,29 @@ class PowerShadesCover(
     def __init__(self, coordinator: PowerShadesCoordinator) -> None:
         """Initialize the PowerShades cover."""
         super().__init__(coordinator)
-        if coordinator.serial_number:
-            self._attr_unique_id = f"{DOMAIN}_{coordinator.serial_number}_cover"
-        else:
-            self._attr_unique_id = f"{DOMAIN}_{coordinator.entry_id}_cover"
+        self._attr_unique_id = f"{coordinator.unique_id_base}_cover"
         self._attr_device_info = coordinator.device_info
+        self._update_attrs()
 
-    @property
-    def current_cover_position(self) -> int | None:
-        """Return the current position of the cover."""
-        return self.coordinator.data.position
-
-    @property
-    def is_closed(self) -> bool | None:
-        """Return if the cover is closed."""
-        position = self.coordinator.data.position
-        if position is None:
-            return None
-        return position == 0
-
-    @property
-    def is_opening(self) -> bool:
-        """Return if the cover is opening."""
-        data = self.coordinator.data
-        return (
-            data.target_position is not None
-            and data.position is not None
-            and data.target_position > data.position
-        )
-
-    @property
-    def is_closing(self) -> bool:
-        """Return if the cover is closing."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Derive the cover state from the coordinator data.
+
+        Computed once per update instead of on every property read.
+        """
         data = self.coordinator.data
-        return (
-            data.target_position is not None
-            and data.position is not None
-            and data.target_position < data.position
-        )
+        position = data.position
+        target = data.target_position
+        self._attr_current_cover_position = position
+        self._attr_is_closed = None if position is None else position == 0
+        moving = target is not None and position is not None
+        self._attr_is_opening = moving and target > position
+        self._attr_is_closing = moving and target < position
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
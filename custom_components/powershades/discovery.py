@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import timedelta
 
 from homeassistant.config_entries import SOURCE_INTEGRATION_DISCOVERY
@@ -9,13 +10,39 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import discovery_flow
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.start import async_at_started
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN
-from .udp import async_discover_devices
+from .udp import async_discover_devices, async_iter_discover_devices
 
 _LOGGER = logging.getLogger(__name__)
 
 DISCOVERY_INTERVAL = timedelta(minutes=15)
+# How long a scan result is reused by the config flow, in seconds
+DISCOVERY_CACHE_TTL = 10.0
+
+DATA_DISCOVERY_CACHE: HassKey[tuple[float, list[dict]]] = HassKey(
+    f"{DOMAIN}_discovery_cache")
+
+
+async def async_get_discovered_devices(
+    hass: HomeAssistant, idle_timeout: float | None = None
+) -> list[dict]:
+    """Return the devices found by a recent scan, scanning if stale.
+
+    Empty results are not cached, so retrying after a scan that found
+    nothing broadcasts again.
+    """
+    cached = hass.data.get(DATA_DISCOVERY_CACHE)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] < DISCOVERY_CACHE_TTL
+    ):
+        return cached[1]
+    devices = await async_discover_devices(hass, idle_timeout=idle_timeout)
+    if devices:
+        hass.data[DATA_DISCOVERY_CACHE] = (time.monotonic(), devices)
+    return devices
 
 
 @callback
@@ -23,14 +50,17 @@ def async_start_discovery(hass: HomeAssistant) -> None:
     """Start periodic background discovery of PowerShades devices."""
 
     async def _async_scan(*_) -> None:
-        devices = await async_discover_devices(hass)
-        for device in devices:
+        devices: list[dict] = []
+        async for device in async_iter_discover_devices(hass):
+            devices.append(device)
             discovery_flow.async_create_flow(
                 hass,
                 DOMAIN,
                 context={"source": SOURCE_INTEGRATION_DISCOVERY},
                 data=device,
             )
+        if devices:
+            hass.data[DATA_DISCOVERY_CACHE] = (time.monotonic(), devices)
         # The broadcast made our short-lived discovery socket every
         # shade's "last UDP master", diverting async move feedback.
         # Poll once from each coordinator to re-assert its socket.
@@ -17,7 +17,6 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import (
     PowerShadesConfigEntry,
     PowerShadesCoordinator,
@@ -87,14 +86,8 @@ class PowerShadesSensor(
         """Initialize the PowerShades sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        if coordinator.serial_number:
-            self._attr_unique_id = (
-                f"{DOMAIN}_{coordinator.serial_number}_{description.key}"
-            )
-        else:
-            self._attr_unique_id = (
-                f"{DOMAIN}_{coordinator.entry_id}_{description.key}"
-            )
+        self._attr_unique_id = (
+            f"{coordinator.unique_id_base}_{description.key}")
         self._attr_device_info = coordinator.device_info
 
     @property
@@ -19,6 +19,18 @@ _LOGGER = logging.getLogger(__name__)
 
 SERVICE_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id})
 
+# Services that call a coordinator method without arguments
+COORDINATOR_SERVICES: dict[str, str] = {
+    "toggle_shade": "async_toggle",
+    "set_upper_limit": "async_set_upper_limit",
+    "set_lower_limit": "async_set_lower_limit",
+    "clear_limits": "async_clear_limits",
+    "step_up": "async_step_up",
+    "step_down": "async_step_down",
+    "jog_up": "async_jog_up",
+    "jog_down": "async_jog_down",
+}
+
 
 def _get_coordinator(
     hass: HomeAssistant, call: ServiceCall
@@ -40,29 +52,9 @@ def _get_coordinator(
 def async_setup_services(hass: HomeAssistant) -> None:
     """Set up PowerShades services."""
 
-    async def toggle_shade(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_toggle()
-
-    async def set_upper_limit(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_set_upper_limit()
-
-    async def set_lower_limit(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_set_lower_limit()
-
-    async def clear_limits(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_clear_limits()
-
-    async def step_up(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_step_up()
-
-    async def step_down(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_step_down()
-
-    async def jog_up(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_jog_up()
-
-    async def jog_down(call: ServiceCall) -> None:
-        await _get_coordinator(hass, call).async_jog_down()
+    async def coordinator_service(call: ServiceCall) -> None:
+        coordinator = _get_coordinator(hass, call)
+        await getattr(coordinator, COORDINATOR_SERVICES[call.service])()
 
     async def set_shade_name(call: ServiceCall) -> None:
         name = call.data["name"].strip()
@@ -71,18 +63,9 @@ def async_setup_services(hass: HomeAssistant) -> None:
                 "Shade name must be 1-50 ASCII characters")
         await _get_coordinator(hass, call).async_set_shade_name(name)
 
-    for name, handler in (
-        ("toggle_shade", toggle_shade),
-        ("set_upper_limit", set_upper_limit),
-        ("set_lower_limit", set_lower_limit),
-        ("clear_limits", clear_limits),
-        ("step_up", step_up),
-        ("step_down", step_down),
-        ("jog_up", jog_up),
-        ("jog_down", jog_down),
-    ):
+    for name in COORDINATOR_SERVICES:
         hass.services.async_register(
-            DOMAIN, name, handler, schema=SERVICE_SCHEMA)
+            DOMAIN, name, coordinator_service, schema=SERVICE_SCHEMA)
 
     hass.services.async_register(
         DOMAIN, "set_shade_name", set_shade_name,
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 
 from homeassistant.components import network
 from homeassistant.core import HomeAssistant
@@ -19,7 +19,9 @@ from .const import (
     UDP_PORT,
 )
 from .protocol import (
+    DISCOVERY_PACKET,
     GET_SHADE_NAME_PAYLOAD,
+    STATUS_REQUEST_PACKETS,
     StatusReply,
     build_packet,
     parse_device_name_reply,
@@ -40,48 +42,86 @@ class PowerShadesTimeoutError(Exception):
 
 
 class _PowerShadesProtocol(asyncio.DatagramProtocol):
-    """Datagram protocol routing replies to pending requests and status pushes."""
+    """Datagram protocol routing packets to connections by source IP."""
 
-    def __init__(self, on_status: Callable[[StatusReply], None]) -> None:
-        self._on_status = on_status
-        # Keyed by op alone: real shades do not reliably echo the
-        # request's sequence (Get Status always replies sequence 1,
-        # whatever was sent). Requests on a connection are serialized,
-        # so at most one request per op is pending at a time.
-        self.pending: dict[int, asyncio.Future[bytes]] = {}
+    def __init__(
+        self, connections: dict[str, PowerShadesConnection]
+    ) -> None:
+        self._connections = connections
 
     def datagram_received(self, data: bytes, addr) -> None:
-        if not verify_packet(data):
-            _LOGGER.debug("Dropping invalid packet from %s: %s",
-                          addr[0], data.hex())
-            return
-        header = parse_header(data)
-        _LOGGER.debug("Received op=0x%02X seq=%d from %s: %s",
-                      header.op, header.sequence, addr[0], data.hex())
-        fut = self.pending.pop(header.op, None)
-        if fut is not None and not fut.done():
-            fut.set_result(data)
+        connection = self._connections.get(addr[0])
+        if connection is None:
+            _LOGGER.debug("Dropping packet from unknown source %s", addr[0])
             return
-        # Unsolicited packet — push status updates to the coordinator
-        if header.op == OP_GET_STATUS:
-            status = parse_status_reply(data)
-            if status is not None:
-                self._on_status(status)
+        connection._handle_packet(data)
 
     def error_received(self, exc: Exception) -> None:
         _LOGGER.debug("UDP error received: %s", exc)
 
 
+class PowerShadesEndpoint:
+    """A UDP socket shared by the connections to several devices.
+
+    Replies and status pushes are routed to the connection for their
+    source address, so one socket serves every configured shade. The
+    socket is opened when the first connection attaches and closed
+    when the last one detaches.
+    """
+
+    def __init__(self) -> None:
+        self._transport: asyncio.DatagramTransport | None = None
+        self._connections: dict[str, PowerShadesConnection] = {}
+        self._open_lock = asyncio.Lock()
+
+    async def async_attach(self, connection: PowerShadesConnection) -> None:
+        """Route packets from the connection's host to it."""
+        async with self._open_lock:
+            if self._transport is None:
+                loop = asyncio.get_running_loop()
+                self._transport, _protocol = (
+                    await loop.create_datagram_endpoint(
+                        lambda: _PowerShadesProtocol(self._connections),
+                        local_addr=("0.0.0.0", 0),
+                    )
+                )
+        self._connections[connection.host] = connection
+
+    def detach(self, connection: PowerShadesConnection) -> None:
+        """Stop routing to the connection; close the socket if unused."""
+        if self._connections.get(connection.host) is connection:
+            del self._connections[connection.host]
+        if not self._connections and self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def sendto(self, packet: bytes, host: str) -> None:
+        """Send a packet to a device."""
+        if self._transport is None:
+            raise PowerShadesTimeoutError("Connection is closed")
+        self._transport.sendto(packet, (host, UDP_PORT))
+
+
 class PowerShadesConnection:
-    """A single UDP endpoint talking to one PowerShades device."""
+    """Request/reply exchange with one PowerShades device.
+
+    Uses the given shared endpoint, or a private one if none is given.
+    """
 
-    def __init__(self, host: str) -> None:
+    def __init__(
+        self, host: str, endpoint: PowerShadesEndpoint | None = None
+    ) -> None:
         self._host = host
-        self._transport: asyncio.DatagramTransport | None = None
-        self._protocol: _PowerShadesProtocol | None = None
+        self._endpoint = endpoint or PowerShadesEndpoint()
+        self._connected = False
         self._lock = asyncio.Lock()
         self._sequence = 0
         self._status_callback: Callable[[StatusReply], None] | None = None
+        # Keyed by op alone: real shades do not reliably echo the
+        # request's sequence (Get Status always replies sequence 1,
+        # whatever was sent). Requests on a connection are serialized,
+        # so at most one request per op is pending at a time.
+        self._pending: dict[int, asyncio.Future[bytes]] = {}
 
     @property
     def host(self) -> str:
@@ -94,24 +134,44 @@ class PowerShadesConnection:
         """Set the callback invoked for every received status packet."""
         self._status_callback = callback
 
-    def _handle_status(self, status: StatusReply) -> None:
-        if self._status_callback is not None:
-            self._status_callback(status)
+    def _handle_packet(self, data: bytes) -> None:
+        """Handle a packet received from the device."""
+        # .hex() is evaluated eagerly, so only build it when logging
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if not verify_packet(data):
+            if debug:
+                _LOGGER.debug("Dropping invalid packet from %s: %s",
+                              self._host, data.hex())
+            return
+        header = parse_header(data)
+        if debug:
+            _LOGGER.debug("Received op=0x%02X seq=%d from %s: %s",
+                          header.op, header.sequence, self._host, data.hex())
+        fut = self._pending.pop(header.op, None)
+        if fut is not None and not fut.done():
+            fut.set_result(data)
+            return
+        # Unsolicited packet — push status updates to the coordinator
+        if header.op == OP_GET_STATUS and self._status_callback is not None:
+            status = parse_status_reply(data)
+            if status is not None:
+                self._status_callback(status)
 
     async def async_connect(self) -> None:
-        """Create the datagram endpoint on an ephemeral local port."""
-        loop = asyncio.get_running_loop()
-        self._transport, self._protocol = await loop.create_datagram_endpoint(
-            lambda: _PowerShadesProtocol(self._handle_status),
-            local_addr=("0.0.0.0", 0),
-        )
+        """Attach to the endpoint, opening its socket if needed."""
+        await self._endpoint.async_attach(self)
+        self._connected = True
 
     def _send(self, op: int, sequence: int, payload: bytes = b"") -> None:
         """Send one packet."""
-        packet = build_packet(op, sequence, payload=payload)
-        self._transport.sendto(packet, (self._host, UDP_PORT))
-        _LOGGER.debug("Sent op=0x%02X seq=%d to %s:%d: %s",
-                      op, sequence, self._host, UDP_PORT, packet.hex())
+        if op == OP_GET_STATUS and not payload:
+            packet = STATUS_REQUEST_PACKETS[sequence]
+        else:
+            packet = build_packet(op, sequence, payload=payload)
+        self._endpoint.sendto(packet, self._host)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sent op=0x%02X seq=%d to %s:%d: %s",
+                          op, sequence, self._host, UDP_PORT, packet.hex())
 
     def _next_sequence(self) -> int:
         self._sequence = (self._sequence + 1) % 256
@@ -125,7 +185,7 @@ class PowerShadesConnection:
         retries: int = REQUEST_RETRIES,
     ) -> bytes:
         """Send a packet and wait for the reply echoing its op and sequence."""
-        if self._protocol is None or self._transport is None:
+        if not self._connected:
             raise PowerShadesTimeoutError("Connection is closed")
         async with self._lock:
             # Each attempt still sends a fresh sequence ("adjacent
@@ -136,61 +196,73 @@ class PowerShadesConnection:
                 fut: asyncio.Future[bytes] = (
                     asyncio.get_running_loop().create_future()
                 )
-                self._protocol.pending[op] = fut
-                self._send(op, sequence, payload)
+                self._pending[op] = fut
                 try:
+                    self._send(op, sequence, payload)
                     return await asyncio.wait_for(fut, timeout)
                 except TimeoutError:
                     pass
                 finally:
-                    if self._protocol is not None:
-                        self._protocol.pending.pop(op, None)
+                    self._pending.pop(op, None)
             raise PowerShadesTimeoutError(
                 f"No reply to op 0x{op:02X} from {self._host}"
             )
 
     def close(self) -> None:
-        """Close the endpoint."""
-        if self._transport is not None:
-            self._transport.close()
-            self._transport = None
-            self._protocol = None
+        """Detach from the endpoint."""
+        if self._connected:
+            self._endpoint.detach(self)
+            self._connected = False
 
 
 class _DiscoveryProtocol(asyncio.DatagramProtocol):
-    """Collects Get Serial replies during broadcast discovery."""
+    """Reports Get Serial replies during broadcast discovery."""
 
-    def __init__(self, results: dict[str, dict]) -> None:
-        self._results = results
+    def __init__(
+        self, seen: set[str], on_device: Callable[[dict], None]
+    ) -> None:
+        self._seen = seen
+        self._on_device = on_device
 
     def datagram_received(self, data: bytes, addr) -> None:
+        # Key by the packet source address — it is authoritative, the
+        # IP embedded in the reply payload is not. Devices answer every
+        # broadcast, so skip repeats before verifying or parsing them.
+        if addr[0] in self._seen:
+            return
         if not verify_packet(data):
             _LOGGER.debug("Dropping invalid discovery reply from %s", addr[0])
             return
         parsed = parse_serial_reply(data)
-        # Key by the packet source address — it is authoritative, the
-        # IP embedded in the reply payload is not.
-        if parsed is not None and addr[0] not in self._results:
-            self._results[addr[0]] = {
-                "ip": addr[0],
-                "serial": parsed["serial"],
-                "model": parsed["model"],
-            }
-            _LOGGER.debug("Discovered device %s (serial %s)",
-                          addr[0], parsed["serial"])
+        if parsed is None:
+            return
+        self._seen.add(addr[0])
+        _LOGGER.debug("Discovered device %s (serial %s)",
+                      addr[0], parsed["serial"])
+        self._on_device({
+            "ip": addr[0],
+            "serial": parsed["serial"],
+            "model": parsed["model"],
+        })
 
     def error_received(self, exc: Exception) -> None:
         _LOGGER.debug("Discovery UDP error: %s", exc)
 
 
-async def async_discover_devices(
-    hass: HomeAssistant, timeout: float = DISCOVERY_TIMEOUT
-) -> list[dict]:
-    """Discover PowerShades devices via UDP broadcast on all adapters."""
+async def async_iter_discover_devices(
+    hass: HomeAssistant,
+    timeout: float = DISCOVERY_TIMEOUT,
+    idle_timeout: float | None = None,
+) -> AsyncIterator[dict]:
+    """Discover PowerShades devices, yielding each as soon as it replies.
+
+    Stops after `timeout` seconds, or — once at least one device has
+    replied — after `idle_timeout` seconds without a new reply.
+    """
     loop = asyncio.get_running_loop()
-    results: dict[str, dict] = {}
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    seen: set[str] = set()
     transports: list[asyncio.DatagramTransport] = []
-    packet = build_packet(OP_GET_SERIAL, sequence=0x01)
 
     adapters = await network.async_get_adapters(hass)
     for adapter in adapters:
@@ -199,7 +271,7 @@ async def async_discover_devices(
         for ip_info in adapter["ipv4"]:
             try:
                 transport, _protocol = await loop.create_datagram_endpoint(
-                    lambda: _DiscoveryProtocol(results),
+                    lambda: _DiscoveryProtocol(seen, queue.put_nowait),
                     local_addr=(ip_info["address"], 0),
                     allow_broadcast=True,
                 )
@@ -207,20 +279,38 @@ async def async_discover_devices(
                 _LOGGER.debug("Could not bind discovery socket to %s: %s",
                               ip_info["address"], err)
                 continue
-            transport.sendto(packet, (BROADCAST_IP, UDP_PORT))
+            transport.sendto(DISCOVERY_PACKET, (BROADCAST_IP, UDP_PORT))
             transports.append(transport)
 
     if not transports:
         _LOGGER.warning("No network adapters available for discovery")
-        return []
+        return
 
+    deadline = loop.time() + timeout
     try:
-        await asyncio.sleep(timeout)
+        while (remaining := deadline - loop.time()) > 0:
+            if seen and idle_timeout is not None:
+                remaining = min(remaining, idle_timeout)
+            try:
+                device = await asyncio.wait_for(queue.get(), remaining)
+            except TimeoutError:
+                break
+            yield device
     finally:
         for transport in transports:
             transport.close()
 
-    devices = list(results.values())
+
+async def async_discover_devices(
+    hass: HomeAssistant,
+    timeout: float = DISCOVERY_TIMEOUT,
+    idle_timeout: float | None = None,
+) -> list[dict]:
+    """Discover PowerShades devices via UDP broadcast on all adapters."""
+    devices = [
+        device async for device in async_iter_discover_devices(
+            hass, timeout, idle_timeout)
+    ]
     _LOGGER.info("Discovery complete, found %d device(s)", len(devices))
     return devices
 